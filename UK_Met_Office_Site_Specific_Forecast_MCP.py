@@ -1,26 +1,102 @@
 #!/usr/bin/env python3
 import os
+import asyncio
 import logging
-from typing import Any
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Any, NamedTuple
 import httpx
+import msgspec
+import numpy as np
+from cachetools import LRUCache, TTLCache
 from mcp.server.fastmcp import FastMCP
 
-# Set up basic logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import _forecast_fmt
+except ImportError:
+    _forecast_fmt = None
 
-# Initialize FastMCP server
-mcp = FastMCP("UK_weather")
+# Module logger; handlers and levels are left to the embedding application
+_log = logging.getLogger("uk_weather_mcp")
 
 # Constants
 MET_OFFICE_API_BASE = "https://data.hub.api.metoffice.gov.uk/sitespecific/v0/point"
-MET_OFFICE_API_KEY = os.getenv("MET_OFFICE_API_KEY")
 
-if not MET_OFFICE_API_KEY:
-    raise ValueError("MET_OFFICE_API_KEY environment variable not set. Please set it in your .bashrc or similar.")
+# Shared HTTP client so repeated forecast calls reuse pooled (HTTP/2) connections.
+# Created on first use, so importing the module needs no API key.
+_CLIENT: httpx.AsyncClient | None = None
+
+# Forecasts are refreshed upstream at most hourly, so parsed responses are
+# cached per (forecast type, rounded location) for a type-specific TTL.
+_FORECAST_CACHES: dict[str, TTLCache] = {
+    "hourly": TTLCache(maxsize=1024, ttl=600),
+    "daily": TTLCache(maxsize=1024, ttl=3600),
+}
+# Last response and its ETag/Last-Modified validators per cache key. Kept beyond
+# the TTL so expired entries can be revalidated with a conditional request.
+_REVALIDATION_CACHE: LRUCache = LRUCache(maxsize=1024)
+# In-flight fetch per cache key; concurrent misses await the same task and so
+# share its outcome, failures included
+_IN_FLIGHT: dict[tuple[str, float, float], asyncio.Task] = {}
+# Caps concurrent API requests from bulk (multi-location) forecast calls
+_BULK_SEMAPHORE = asyncio.Semaphore(10)
+# Most distinct locations a single bulk call may request, to protect the API quota
+_MAX_BULK_POINTS = 20
+
+
+@cache
+def _api_key() -> str:
+    """Returns the Met Office API key from the environment."""
+    api_key = os.getenv("MET_OFFICE_API_KEY")
+    if not api_key:
+        raise ValueError("MET_OFFICE_API_KEY environment variable not set. Please set it in your .bashrc or similar.")
+    return api_key
+
+
+def _client() -> httpx.AsyncClient:
+    """Returns the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            base_url=MET_OFFICE_API_BASE,
+            headers={
+                "accept": "application/json",
+                "accept-encoding": "gzip, br",
+                "apikey": _api_key()
+            },
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    """Closes the shared HTTP client, if it was created."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def _run_stdio() -> None:
+    """Runs the server over stdio, closing the shared HTTP client when it exits.
+
+    The client is process-wide, so it is closed here rather than in a FastMCP
+    lifespan, which runs once per client session.
+    """
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        # Must run on the server's event loop, which owns the pooled connections
+        await _close_client()
+
 
-# Weather code lookup table
-WEATHER_CODES = {
-    "NA": "Not available",
+# Initialize FastMCP server
+mcp = FastMCP("UK_weather")
+
+# Weather code lookup table (read-only, integer codes only)
+WEATHER_CODES = MappingProxyType({
     0: "Clear night",
     1: "Sunny day",
     2: "Partly cloudy (night)",
@@ -52,159 +128,462 @@ WEATHER_CODES = {
     28: "Thunder shower (night)",
     29: "Thunder shower (day)",
     30: "Thunder"
-}
+})
 
+# Description for a missing code (the API omits it or sends "NA")
+_NOT_AVAILABLE = "Not available"
+
+# Dense tuple of descriptions indexed directly by weather code
+_WEATHER_DESCRIPTIONS = tuple(WEATHER_CODES.get(i, "Not used") for i in range(31))
+
+@lru_cache(maxsize=64)
 def get_weather_description(code: Any) -> str:
     """Returns the human-readable description for a given weather code."""
-    try:
-        return WEATHER_CODES.get(int(code), f"Unknown code: {code}")
-    except (ValueError, TypeError):
-        return WEATHER_CODES.get(str(code), f"Unknown code: {code}")
-
-async def _make_met_office_request(url: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
-    """Make a request to the Met Office API with proper error handling."""
-    headers = {
-        "accept": "application/json",
-        "apikey": MET_OFFICE_API_KEY
-    }
-    async with httpx.AsyncClient() as client:
+    if type(code) is int:
+        index = code
+    elif code is None or code == "NA":
+        return _NOT_AVAILABLE
+    else:
         try:
-            response = await client.get(url, headers=headers, params=params, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            logging.error(f"HTTP Error: {e.response.status_code} - {e.response.text}")
-            return None
-        except Exception as e:
-            logging.error(f"An error occurred: {e}")
-            return None
-
-
-async def _get_forecast_data(forecast_type: str, latitude: float, longitude: float) -> dict[str, Any] | None:
+            index = int(code)
+        except (ValueError, TypeError):
+            return f"Unknown code: {code}"
+    if 0 <= index < len(_WEATHER_DESCRIPTIONS):
+        return _WEATHER_DESCRIPTIONS[index]
+    return f"Unknown code: {code}"
+
+
+# Response schemas. Only the fields rendered by the forecast tools are declared;
+# everything else in the GeoJSON payload is skipped during decoding. Numeric
+# fields accept both ints and floats (and codes also strings such as "NA") so
+# that one oddly-typed value doesn't fail the whole response.
+class HourlyPeriod(msgspec.Struct, gc=False):
+    time: str = "N/A"
+    screenTemperature: int | float | None = None
+    feelsLikeTemperature: int | float | None = None
+    screenRelativeHumidity: int | float | None = None
+    windSpeed10m: int | float | None = None
+    windDirectionFrom10m: int | float | None = None
+    significantWeatherCode: int | float | str | None = None
+    precipitationRate: int | float | None = None
+    probOfPrecipitation: int | float | None = None
+    visibility: int | float | None = None
+    uvIndex: int | float | None = None
+    mslp: int | float | None = None
+
+
+class DailyPeriod(msgspec.Struct, gc=False):
+    time: str
+    dayMaxScreenTemperature: int | float | None = None
+    nightMinScreenTemperature: int | float | None = None
+    dayMaxFeelsLikeTemp: int | float | None = None
+    nightMinFeelsLikeTemp: int | float | None = None
+    dayProbabilityOfPrecipitation: int | float | None = None
+    nightProbabilityOfPrecipitation: int | float | None = None
+    maxUvIndex: int | float | None = None
+    middayRelativeHumidity: int | float | None = None
+    middayVisibility: int | float | None = None
+    middayMslp: int | float | None = None
+    midday10MWindSpeed: int | float | None = None
+    daySignificantWeatherCode: int | float | str | None = None
+    nightSignificantWeatherCode: int | float | str | None = None
+
+
+class Geometry(msgspec.Struct):
+    coordinates: list[float]
+
+
+class Location(msgspec.Struct):
+    name: str
+
+
+class HourlyProperties(msgspec.Struct):
+    timeSeries: list[HourlyPeriod]
+
+
+class DailyProperties(msgspec.Struct):
+    location: Location
+    timeSeries: list[DailyPeriod]
+
+
+class HourlyFeature(msgspec.Struct):
+    geometry: Geometry
+    properties: HourlyProperties
+
+
+class DailyFeature(msgspec.Struct):
+    properties: DailyProperties
+
+
+class HourlyResponse(msgspec.Struct):
+    features: list[HourlyFeature]
+
+
+class DailyResponse(msgspec.Struct):
+    features: list[DailyFeature]
+
+
+_DECODERS: dict[str, msgspec.json.Decoder] = {
+    "hourly": msgspec.json.Decoder(HourlyResponse),
+    "daily": msgspec.json.Decoder(DailyResponse),
+}
+
+
+class _CachedResponse(NamedTuple):
+    """A decoded response plus the conditional headers needed to revalidate it."""
+    data: Any
+    validators: dict[str, str]
+
+
+async def _make_met_office_request(
+    path: str,
+    decoder: msgspec.json.Decoder,
+    params: dict[str, Any] | None = None,
+    previous: _CachedResponse | None = None,
+) -> _CachedResponse | None:
+    """Make a request to the Met Office API with proper error handling.
+
+    If a previous response is given its validators are sent with the request,
+    and it is returned unchanged when the API replies 304 Not Modified.
+    """
+    client = _client()
+    try:
+        response = await client.get(path, params=params, headers=previous.validators if previous else None)
+        if response.status_code == 304 and previous:
+            return previous
+        response.raise_for_status()
+
+        validators = {}
+        if etag := response.headers.get("etag"):
+            validators["if-none-match"] = etag
+        if last_modified := response.headers.get("last-modified"):
+            validators["if-modified-since"] = last_modified
+        return _CachedResponse(decoder.decode(response.content), validators)
+    except httpx.HTTPStatusError as e:
+        _log.error(f"HTTP Error: {e.response.status_code} - {e.response.text}")
+        return None
+    except msgspec.ValidationError:
+        # Valid JSON that doesn't match the schema; the tools report it as a parse failure
+        raise
+    except msgspec.DecodeError as e:
+        _log.error(f"Failed to decode {path} response: {e}")
+        return None
+    except Exception as e:
+        _log.error(f"An error occurred: {e}")
+        return None
+
+
+async def _fetch_forecast_data(
+    forecast_type: str, latitude: float, longitude: float, previous: _CachedResponse | None = None
+) -> _CachedResponse | None:
     """Fetches forecast data from the Met Office API."""
-    url = f"{MET_OFFICE_API_BASE}/{forecast_type}"
     params = {
         "dataSource": "BD1",
         "latitude": latitude,
         "longitude": longitude,
         "includeLocationName": "true",
     }
-    return await _make_met_office_request(url, params=params)
-
-
-def _format_forecast_section(title: str, data: dict[str, Any]) -> str:
-    """Formats a section of the forecast."""
-    lines = [f"---", title]
-    for key, value in data.items():
-        lines.append(f"{key}: {value}")
-    return "\n".join(lines)
-
-
-def _parse_hourly_forecast(time_series: list[dict[str, Any]]) -> str:
-    """Parses and formats the hourly forecast data."""
-    forecasts = []
-    for period in time_series:
-        time = period.get("time", "N/A")
-        temp = period.get("screenTemperature", "N/A")
-        feels_like = period.get("feelsLikeTemperature", "N/A")
-        humidity = period.get("screenRelativeHumidity", "N/A")
-        wind_speed = period.get("windSpeed10m", "N/A")
-        wind_direction = period.get("windDirectionFrom10m", "N/A")
-        weather_code = period.get("significantWeatherCode", "NA")
-        precipitation_rate = period.get("precipitationRate", "N/A")
-        precipitation_prob = period.get("probOfPrecipitation", "N/A")
-        visibility = period.get("visibility", "N/A")
-        uv_index = period.get("uvIndex", "N/A")
-        pressure = period.get("mslp", "N/A")
-
-        weather_desc = get_weather_description(weather_code)
-
-        wind_speed_mph = f"{wind_speed * 2.237:.1f}" if isinstance(wind_speed, (int, float)) else "N/A"
-        pressure_mb = f"{pressure / 100:.1f}" if isinstance(pressure, (int, float)) else "N/A"
-        visibility_km = f"{visibility / 1000:.1f}" if isinstance(visibility, (int, float)) else "N/A"
-
-        forecast_data = {
-            "Temperature": f'{temp}°C (feels like {feels_like}°C)',
-            "Weather": weather_desc,
-            "Wind": f"{wind_speed_mph} mph from {wind_direction}°",
-            "Humidity": f"{humidity}%",
-            "Precipitation": f"{precipitation_rate} mm/h ({precipitation_prob}% chance)",
-            "Pressure": f"{pressure_mb} mb",
-            "Visibility": f"{visibility_km} km",
-            "UV Index": uv_index,
-        }
-        forecasts.append(_format_forecast_section(f"Time: {time}", forecast_data))
+    return await _make_met_office_request(forecast_type, _DECODERS[forecast_type], params=params, previous=previous)
 
-    return "\n".join(forecasts)
 
+async def _refresh_forecast_data(
+    key: tuple[str, float, float], latitude: float, longitude: float
+) -> HourlyResponse | DailyResponse | None:
+    """Fetches (or revalidates) forecast data and stores it in the caches."""
+    forecast_type = key[0]
+    response = await _fetch_forecast_data(
+        forecast_type, latitude, longitude, previous=_REVALIDATION_CACHE.get(key)
+    )
+    if not response:
+        return None
+
+    _FORECAST_CACHES[forecast_type][key] = response.data
+    if response.validators:
+        _REVALIDATION_CACHE[key] = response
+    return response.data
 
-def _parse_daily_forecast(time_series: list[dict[str, Any]]) -> str:
-    """Parses and formats the daily forecast data."""
-    def _format(value: Any, unit: str = "", factor: float = 1.0) -> str:
-        if isinstance(value, (int, float)):
-            return f"{(value * factor):.1f}{unit}"
+
+async def _get_forecast_data(
+    forecast_type: str, latitude: float, longitude: float
+) -> HourlyResponse | DailyResponse | None:
+    """Returns forecast data, served from the TTL cache where possible."""
+    cache = _FORECAST_CACHES[forecast_type]
+    key = (forecast_type, round(latitude, 3), round(longitude, 3))
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    task = _IN_FLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_refresh_forecast_data(key, latitude, longitude))
+        _IN_FLIGHT[key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+    # Shielded so one cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+# Unit conversions from the API's SI units. Hourly values are divided by the
+# per-unit divisors; daily values are multiplied by the reciprocal factors.
+_HOURLY_MPS_TO_MPH = 2.237
+_DAILY_MPS_TO_MPH = 2.23694
+_PA_PER_HPA = 100.0
+_M_PER_KM = 1000.0
+_HPA_PER_PA = 1 / _PA_PER_HPA
+_KM_PER_M = 1 / _M_PER_KM
+
+# Per-period output templates, filled positionally with %-formatting
+_HOURLY_TEMPLATE = (
+    "---\n"
+    "Time: %s\n"
+    "Temperature: %s°C (feels like %s°C)\n"
+    "Weather: %s\n"
+    "Wind: %s mph from %s°\n"
+    "Humidity: %s%%\n"
+    "Precipitation: %s mm/h (%s%% chance)\n"
+    "Pressure: %s mb\n"
+    "Visibility: %s km\n"
+    "UV Index: %s"
+)
+_DAILY_TEMPLATE = (
+    "---\n"
+    "Date: %s\n"
+    "Max Temp: %s\n"
+    "Min Temp: %s\n"
+    "Feels Like Max Temp: %s\n"
+    "Feels Like Min Temp (Night): %s\n"
+    "Day Precipitation Probability: %s\n"
+    "Night Precipitation Probability: %s\n"
+    "Max UV Index: %s\n"
+    "Midday Relative Humidity: %s\n"
+    "Midday Visibility: %s\n"
+    "Midday Pressure (MSL): %s\n"
+    "Wind Speed (10m): %s\n"
+    "Weather: %s (Day), %s (Night)"
+)
+
+
+def _or_na(value: Any) -> Any:
+    """Substitutes "N/A" for a missing value."""
+    return "N/A" if value is None else value
+
+
+def _format_scaled(value: float | None, unit: str = "", factor: float = 1.0) -> str:
+    """Formats a scaled value to one decimal place with its unit, or "N/A" if missing."""
+    if value is None:
         return "N/A"
+    return f"{(value * factor):.1f}{unit}"
+
+
+def _column(time_series: list[Any], field: str) -> np.ndarray:
+    """Extracts a numeric field as a float array, with NaN for missing values."""
+    return np.fromiter(
+        (np.nan if (value := getattr(period, field)) is None else value for period in time_series),
+        dtype=np.float64,
+        count=len(time_series),
+    )
+
+
+def _format_column(values: np.ndarray) -> list[str]:
+    """Formats a float array to one decimal place, with "N/A" for NaN."""
+    return np.where(np.isnan(values), "N/A", np.char.mod("%.1f", values)).tolist()
+
+
+def _convert_hourly_units(
+    wind_speed: np.ndarray, pressure: np.ndarray, visibility: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Converts wind speed (m/s) to mph, pressure (Pa) to mb and visibility (m) to km."""
+    return wind_speed * _HOURLY_MPS_TO_MPH, pressure / _PA_PER_HPA, visibility / _M_PER_KM
 
-    forecasts = []
-    for period in time_series:
-        date = period['time'].split('T')[0]
-
-        forecast_data = {
-            "Max Temp": _format(period.get('dayMaxScreenTemperature'), "°C"),
-            "Min Temp": _format(period.get('nightMinScreenTemperature'), "°C"),
-            "Feels Like Max Temp": _format(period.get('dayMaxFeelsLikeTemp'), "°C"),
-            "Feels Like Min Temp (Night)": _format(period.get('nightMinFeelsLikeTemp'), "°C"),
-            "Day Precipitation Probability": _format(period.get('dayProbabilityOfPrecipitation'), "%"),
-            "Night Precipitation Probability": _format(period.get('nightProbabilityOfPrecipitation'), "%"),
-            "Max UV Index": _format(period.get('maxUvIndex')),
-            "Midday Relative Humidity": _format(period.get('middayRelativeHumidity'), "%"),
-            "Midday Visibility": _format(period.get('middayVisibility'), " km", 0.001),
-            "Midday Pressure (MSL)": _format(period.get('middayMslp'), " hPa", 0.01),
-            "Wind Speed (10m)": _format(period.get('midday10MWindSpeed'), " mph", 2.23694),
-            "Weather": f"{get_weather_description(period.get('daySignificantWeatherCode', 'NA'))} (Day), "
-                       f"{get_weather_description(period.get('nightSignificantWeatherCode', 'NA'))} (Night)",
-        }
-        forecasts.append(_format_forecast_section(f"Date: {date}", forecast_data))
 
+# Only the pure-Python formatters call this, so numba is imported only when the
+# Cython extension isn't built. Compilation happens lazily on the first call and
+# is cached on disk for later processes.
+if _forecast_fmt is None:
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+    else:
+        _convert_hourly_units = njit(cache=True)(_convert_hourly_units)
+
+
+def _parse_hourly_forecast(title: str, time_series: list[HourlyPeriod]) -> str:
+    """Parses and formats the hourly forecast data under the given title line."""
+    if _forecast_fmt is not None:
+        return _forecast_fmt.format_hourly(
+            title, time_series, _HOURLY_TEMPLATE, get_weather_description,
+            _HOURLY_MPS_TO_MPH, _PA_PER_HPA, _M_PER_KM,
+        )
+
+    wind_speed_mph, pressure_mb, visibility_km = _convert_hourly_units(
+        _column(time_series, "windSpeed10m"),
+        _column(time_series, "mslp"),
+        _column(time_series, "visibility"),
+    )
+    wind_speeds_mph = _format_column(wind_speed_mph)
+    pressures_mb = _format_column(pressure_mb)
+    visibilities_km = _format_column(visibility_km)
+
+    forecasts = [title]
+    forecasts.extend(
+        _HOURLY_TEMPLATE % (
+            period.time,
+            _or_na(period.screenTemperature),
+            _or_na(period.feelsLikeTemperature),
+            get_weather_description(period.significantWeatherCode),
+            wind_speed_mph,
+            _or_na(period.windDirectionFrom10m),
+            _or_na(period.screenRelativeHumidity),
+            _or_na(period.precipitationRate),
+            _or_na(period.probOfPrecipitation),
+            pressure_mb,
+            visibility_km,
+            _or_na(period.uvIndex),
+        )
+        for period, wind_speed_mph, pressure_mb, visibility_km in zip(
+            time_series, wind_speeds_mph, pressures_mb, visibilities_km
+        )
+    )
     return "\n".join(forecasts)
 
 
-@mcp.tool()
-async def get_hourly_forecast(latitude: float, longitude: float) -> str:
-    """Get the hourly weather forecast for a location in the UK."""
-    data = await _get_forecast_data("hourly", latitude, longitude)
+def _parse_daily_forecast(title: str, time_series: list[DailyPeriod]) -> str:
+    """Parses and formats the daily forecast data under the given title line."""
+    if _forecast_fmt is not None:
+        return _forecast_fmt.format_daily(
+            title, time_series, _DAILY_TEMPLATE, get_weather_description,
+            _DAILY_MPS_TO_MPH, _HPA_PER_PA, _KM_PER_M,
+        )
+
+    forecasts = [title]
+    forecasts.extend(
+        _DAILY_TEMPLATE % (
+            period.time.split('T')[0],
+            _format_scaled(period.dayMaxScreenTemperature, "°C"),
+            _format_scaled(period.nightMinScreenTemperature, "°C"),
+            _format_scaled(period.dayMaxFeelsLikeTemp, "°C"),
+            _format_scaled(period.nightMinFeelsLikeTemp, "°C"),
+            _format_scaled(period.dayProbabilityOfPrecipitation, "%"),
+            _format_scaled(period.nightProbabilityOfPrecipitation, "%"),
+            _format_scaled(period.maxUvIndex),
+            _format_scaled(period.middayRelativeHumidity, "%"),
+            _format_scaled(period.middayVisibility, " km", _KM_PER_M),
+            _format_scaled(period.middayMslp, " hPa", _HPA_PER_PA),
+            _format_scaled(period.midday10MWindSpeed, " mph", _DAILY_MPS_TO_MPH),
+            get_weather_description(period.daySignificantWeatherCode),
+            get_weather_description(period.nightSignificantWeatherCode),
+        )
+        for period in time_series
+    )
+    return "\n".join(forecasts)
+
+
+def _format_hourly_forecast(data: HourlyResponse | None) -> str:
+    """Formats a decoded hourly forecast response for display."""
     if not data:
         return "Unable to fetch forecast data for this location."
 
     try:
-        time_series = data["features"][0]["properties"]["timeSeries"]
-        coordinates = data["features"][0]["geometry"]["coordinates"]
+        feature = data.features[0]
+        time_series = feature.properties.timeSeries
+        coordinates = feature.geometry.coordinates
         location_info = f"Location: {coordinates[1]:.4f}°N, {coordinates[0]:.4f}°E"
 
-        forecast_details = _parse_hourly_forecast(time_series)
-        return f"Hourly forecast for {location_info}:\n{forecast_details}"
-    except (KeyError, IndexError) as e:
-        logging.error(f"Failed to parse hourly forecast data: {e}. Raw data: {data}")
+        return _parse_hourly_forecast(f"Hourly forecast for {location_info}:", time_series)
+    except IndexError as e:
+        _log.error(f"Failed to parse hourly forecast data: {e}. Raw data: {data}")
         return "Failed to parse the hourly forecast data."
 
 
-@mcp.tool()
-async def get_daily_forecast(latitude: float, longitude: float) -> str:
-    """Get the daily weather forecast for a location in the UK."""
-    data = await _get_forecast_data("daily", latitude, longitude)
+def _format_daily_forecast(data: DailyResponse | None) -> str:
+    """Formats a decoded daily forecast response for display."""
     if not data:
         return "Unable to fetch forecast data for this location."
 
     try:
-        time_series = data['features'][0]['properties']['timeSeries']
-        location_name = data['features'][0]['properties']['location']['name']
+        properties = data.features[0].properties
+        time_series = properties.timeSeries
+        location_name = properties.location.name
 
-        forecast_details = _parse_daily_forecast(time_series)
-        return f"Daily forecast for {location_name}:\n{forecast_details}"
-    except (KeyError, IndexError) as e:
-        logging.error(f"Failed to parse daily forecast data: {e}. Raw data: {data}")
+        return _parse_daily_forecast(f"Daily forecast for {location_name}:", time_series)
+    except IndexError as e:
+        _log.error(f"Failed to parse daily forecast data: {e}. Raw data: {data}")
         return "Failed to parse the daily forecast data."
 
+
+_FORECAST_FORMATTERS = {"hourly": _format_hourly_forecast, "daily": _format_daily_forecast}
+
+
+async def _get_forecast(forecast_type: str, latitude: float, longitude: float) -> str:
+    """Fetches and formats a forecast, reporting failures as readable messages."""
+    try:
+        data = await _get_forecast_data(forecast_type, latitude, longitude)
+    except msgspec.ValidationError as e:
+        _log.error(f"Failed to parse {forecast_type} forecast data: {e}")
+        return f"Failed to parse the {forecast_type} forecast data."
+    return _FORECAST_FORMATTERS[forecast_type](data)
+
+
+@mcp.tool()
+async def get_hourly_forecast(latitude: float, longitude: float) -> str:
+    """Get the hourly weather forecast for a location in the UK."""
+    return await _get_forecast("hourly", latitude, longitude)
+
+
+@mcp.tool()
+async def get_daily_forecast(latitude: float, longitude: float) -> str:
+    """Get the daily weather forecast for a location in the UK."""
+    return await _get_forecast("daily", latitude, longitude)
+
+
+@mcp.tool()
+async def get_full_forecast(latitude: float, longitude: float) -> str:
+    """Get both the daily and hourly weather forecasts for a location in the UK."""
+    daily, hourly = await asyncio.gather(
+        _get_forecast("daily", latitude, longitude),
+        _get_forecast("hourly", latitude, longitude),
+    )
+    return f"{daily}\n\n{hourly}"
+
+
+@mcp.tool()
+async def get_forecasts_bulk(points: list[tuple[float, float]], forecast_type: str = "daily") -> str:
+    """Get weather forecasts for several locations in the UK at once.
+
+    Points that match to 3 decimal places are fetched and shown once. At most
+    20 distinct locations can be requested per call.
+
+    Args:
+        points: (latitude, longitude) pairs, one per location
+        forecast_type: Either "daily" or "hourly"
+    """
+    if forecast_type not in _FORECAST_FORMATTERS:
+        return f"Unknown forecast type: {forecast_type}. Use 'daily' or 'hourly'."
+
+    # Keep the first point for each rounded location, matching the cache key
+    unique_points: dict[tuple[float, float], tuple[float, float]] = {}
+    for latitude, longitude in points:
+        unique_points.setdefault((round(latitude, 3), round(longitude, 3)), (latitude, longitude))
+    if not unique_points:
+        return "No locations given. Provide at least one (latitude, longitude) pair."
+    if len(unique_points) > _MAX_BULK_POINTS:
+        return f"Too many locations: {len(unique_points)}. At most {_MAX_BULK_POINTS} can be requested at once."
+
+    async def fetch(latitude: float, longitude: float) -> str:
+        async with _BULK_SEMAPHORE:
+            return await _get_forecast(forecast_type, latitude, longitude)
+
+    results = await asyncio.gather(
+        *(fetch(latitude, longitude) for latitude, longitude in unique_points.values())
+    )
+    return "\n\n".join(results)
+
 if __name__ == "__main__":
-    # Initialize and run the server
-    mcp.run()
\ No newline at end of file
+    # Initialize and run the server, on uvloop's faster event loop where it is
+    # installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_run_stdio())
+    else:
+        uvloop.run(_run_stdio())
\ No newline at end of file
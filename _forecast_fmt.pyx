@@ -0,0 +1,88 @@
+# cython: language_level=3
+"""Compiled formatters for UK Met Office forecast periods.
+
+Optional accelerator for UK_Met_Office_Site_Specific_Forecast_MCP; build in place with
+``cythonize -3 -i _forecast_fmt.pyx``. The server falls back to its pure-Python
+formatters when this extension is not built.
+"""
+
+
+cdef inline object _or_na(object value):
+    return "N/A" if value is None else value
+
+
+cdef inline str _divided(object value, double divisor):
+    if value is None:
+        return "N/A"
+    return f"{<double>value / divisor:.1f}"
+
+
+cdef inline str _scaled(object value, str unit, double factor=1.0):
+    if value is None:
+        return "N/A"
+    return f"{<double>value * factor:.1f}{unit}"
+
+
+cpdef str format_hourly(
+    str title, list periods, str template, object describe,
+    double mps_to_mph, double pa_per_hpa, double m_per_km,
+):
+    """Formats hourly periods with the server's hourly template, under a title line.
+
+    Wind speed is multiplied by ``mps_to_mph``; pressure and visibility are
+    divided by ``pa_per_hpa`` and ``m_per_km``.
+    """
+    cdef Py_ssize_t i, n = len(periods)
+    cdef list forecasts = [None] * (n + 1)
+    cdef object period
+    forecasts[0] = title
+    for i in range(n):
+        period = periods[i]
+        forecasts[i + 1] = template % (
+            period.time,
+            _or_na(period.screenTemperature),
+            _or_na(period.feelsLikeTemperature),
+            describe(period.significantWeatherCode),
+            _scaled(period.windSpeed10m, "", mps_to_mph),
+            _or_na(period.windDirectionFrom10m),
+            _or_na(period.screenRelativeHumidity),
+            _or_na(period.precipitationRate),
+            _or_na(period.probOfPrecipitation),
+            _divided(period.mslp, pa_per_hpa),
+            _divided(period.visibility, m_per_km),
+            _or_na(period.uvIndex),
+        )
+    return "\n".join(forecasts)
+
+
+cpdef str format_daily(
+    str title, list periods, str template, object describe,
+    double mps_to_mph, double hpa_per_pa, double km_per_m,
+):
+    """Formats daily periods with the server's daily template, under a title line.
+
+    Wind speed, pressure and visibility are multiplied by the given factors.
+    """
+    cdef Py_ssize_t i, n = len(periods)
+    cdef list forecasts = [None] * (n + 1)
+    cdef object period
+    forecasts[0] = title
+    for i in range(n):
+        period = periods[i]
+        forecasts[i + 1] = template % (
+            period.time.split('T')[0],
+            _scaled(period.dayMaxScreenTemperature, "°C"),
+            _scaled(period.nightMinScreenTemperature, "°C"),
+            _scaled(period.dayMaxFeelsLikeTemp, "°C"),
+            _scaled(period.nightMinFeelsLikeTemp, "°C"),
+            _scaled(period.dayProbabilityOfPrecipitation, "%"),
+            _scaled(period.nightProbabilityOfPrecipitation, "%"),
+            _scaled(period.maxUvIndex, ""),
+            _scaled(period.middayRelativeHumidity, "%"),
+            _scaled(period.middayVisibility, " km", km_per_m),
+            _scaled(period.middayMslp, " hPa", hpa_per_pa),
+            _scaled(period.midday10MWindSpeed, " mph", mps_to_mph),
+            describe(period.daySignificantWeatherCode),
+            describe(period.nightSignificantWeatherCode),
+        )
+    return "\n".join(forecasts)